@@ -4,70 +4,285 @@ Temperature monitoring client for the Express app.
 - Consumes /stream (SSE) optionally
 - Computes statistics with numpy and reports alerts for out-of-range values (default 20-80°C)
 """
-from dataclasses import dataclass
-from typing import List, Callable, Optional
-import requests
+from typing import List, AsyncIterable, AsyncIterator, Callable, Optional, Sequence, Tuple
+import httpx
+import ijson
+import msgspec
 import numpy as np
 import time
-import json
+import array
+import asyncio
+import contextlib
+import signal
+import sys
 import threading
-from datetime import datetime
 
 
-@dataclass
-class TemperatureReading:
+# frozen + gc=False: immutable, and only holds a float and a str, so it can skip
+# the GC header and cycle-collector tracking (48 -> 32 bytes per instance)
+class TemperatureReading(msgspec.Struct, frozen=True, gc=False):
     temperature: float
     timestamp: str
 
 
+# strict=False lets msgspec coerce the server's string temperatures ("42.50") to float
+_DECODER = msgspec.json.Decoder(TemperatureReading, strict=False)
+_HISTORY_DECODER = msgspec.json.Decoder(List[TemperatureReading], strict=False)
+
+
+class _TemperatureOnly(msgspec.Struct, gc=False):
+    temperature: float
+
+
+# decodes only the temperature of each /history item; timestamps are skipped, not built
+_HISTORY_TEMPS_DECODER = msgspec.json.Decoder(List[_TemperatureOnly], strict=False)
+
+
+async def _aiter_sse_batches(chunks: AsyncIterable[bytes]) -> AsyncIterator[List[bytes]]:
+    """Yield the raw `data:` payload bytes of the SSE events completed by each chunk."""
+    buf = bytearray()
+    async for chunk in chunks:
+        if not chunk:
+            continue
+        buf += chunk
+        payloads: List[bytes] = []
+        start = 0
+        while (end := buf.find(b"\n\n", start)) != -1:
+            pos = start
+            while pos < end:
+                nl = buf.find(b"\n", pos, end)
+                if nl == -1:
+                    nl = end
+                if buf.startswith(b"data:", pos, nl):
+                    # no strip(): the JSON decoder skips the surrounding whitespace itself
+                    payloads.append(bytes(buf[pos + 5:nl]))
+                pos = nl + 1
+            start = end + 2
+        if start:
+            del buf[:start]
+        if payloads:
+            yield payloads
+
+
+# The server stamps readings in America/Araguaina local time (UTC-3, no DST) using
+# Intl pt-BR formatting, e.g. "15/10/2026, 14:03:05 BRT".
+SERVER_UTC_OFFSET = np.timedelta64(-3, "h")
+
+
+def _to_iso(ts: str) -> str:
+    """Rearrange "dd/mm/yyyy, HH:MM:SS ..." into "yyyy-mm-ddTHH:MM:SS"."""
+    date, rest = ts[:10], ts[10:].lstrip(", ")
+    return f"{date[6:10]}-{date[3:5]}-{date[0:2]}T{rest[:8]}"
+
+
+def _parse_one(iso: str) -> np.datetime64:
+    try:
+        return np.datetime64(iso, "ns")
+    except ValueError:
+        return np.datetime64("NaT", "ns")
+
+
+def _parse_timestamps(timestamps: Sequence[str]) -> np.ndarray:
+    """Parse server timestamps into UTC datetime64[ns]; unparseable ones become NaT."""
+    iso = [_to_iso(ts) for ts in timestamps]
+    try:
+        local = np.array(iso, dtype="datetime64[ns]")
+    except ValueError:
+        local = np.array([_parse_one(s) for s in iso], dtype="datetime64[ns]")
+    return local - SERVER_UTC_OFFSET
+
+
 class TemperatureMonitor:
-    """Object that stores temperature readings and computes statistics/alerts."""
+    """Object that stores temperature readings and computes statistics/alerts.
+
+    Temperatures live in a preallocated float64 array (with a parallel array of
+    timestamps) that doubles in size when full, so statistics run directly on
+    contiguous memory instead of rebuilding an array from Python objects.
+    """
+
+    _INITIAL_CAPACITY = 1024
 
     def __init__(self, safe_min: float = 20.0, safe_max: float = 80.0):
-        self.safe_min = safe_min
-        self.safe_max = safe_max
-        self.readings: List[TemperatureReading] = []
+        self._safe_min = safe_min
+        self._safe_max = safe_max
+        self._cap = self._INITIAL_CAPACITY
+        self._n = 0
+        self._temps = np.empty(self._cap, dtype=np.float64)
+        self._timestamps = np.empty(self._cap, dtype=object)
+        # timestamps parsed once on ingest, so time-window filters are array compares
+        self._times = np.empty(self._cap, dtype="datetime64[ns]")
+        # positions of readings <= safe_min / >= safe_max, maintained on ingest and
+        # rebuilt when a threshold changes; a reading is never in both lists
+        self._cold_idx = array.array("q")
+        self._hot_idx = array.array("q")
+        # _scan result, reused until readings or thresholds change
+        self._scan_cache: Optional[Tuple[int, float, float, float, np.ndarray]] = None
+        self._dirty = True
+
+    @property
+    def safe_min(self) -> float:
+        return self._safe_min
+
+    @safe_min.setter
+    def safe_min(self, value: float) -> None:
+        self._safe_min = value
+        self._reindex()
+        self._dirty = True
+
+    @property
+    def safe_max(self) -> float:
+        return self._safe_max
+
+    @safe_max.setter
+    def safe_max(self, value: float) -> None:
+        self._safe_max = value
+        self._reindex()
+        self._dirty = True
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def temperatures(self) -> np.ndarray:
+        """View of the stored temperatures (no copy)."""
+        return self._temps[:self._n]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """View of the stored timestamps, aligned with `temperatures`."""
+        return self._timestamps[:self._n]
+
+    @property
+    def times(self) -> np.ndarray:
+        """View of the stored timestamps as UTC datetime64[ns] (NaT if unparseable)."""
+        return self._times[:self._n]
+
+    @property
+    def cold_indices(self) -> np.ndarray:
+        """Positions of readings at or below safe_min, in arrival order."""
+        return np.frombuffer(self._cold_idx, dtype=np.int64).copy()
+
+    @property
+    def hot_indices(self) -> np.ndarray:
+        """Positions of readings at or above safe_max, in arrival order."""
+        return np.frombuffer(self._hot_idx, dtype=np.int64).copy()
+
+    def recent_mask(self, seconds: float, idx: Optional[np.ndarray] = None) -> np.ndarray:
+        """Boolean mask of readings stamped within the last `seconds`.
+
+        idx: restrict the check to these positions (the mask is aligned with idx)
+        """
+        cutoff = np.datetime64("now", "ns") - np.timedelta64(int(seconds * 1e9), "ns")
+        times = self.times if idx is None else self._times[idx]
+        return times > cutoff
+
+    def _grow(self, needed: int) -> None:
+        """Double the capacity until at least `needed` readings fit."""
+        cap = self._cap
+        while cap < needed:
+            cap *= 2
+        temps = np.empty(cap, dtype=np.float64)
+        temps[:self._n] = self._temps[:self._n]
+        timestamps = np.empty(cap, dtype=object)
+        timestamps[:self._n] = self._timestamps[:self._n]
+        times = np.empty(cap, dtype="datetime64[ns]")
+        times[:self._n] = self._times[:self._n]
+        self._temps, self._timestamps, self._times, self._cap = temps, timestamps, times, cap
+
+    def _append_block(self, temps: np.ndarray, timestamps: Sequence[str]) -> None:
+        """Copy a block of temperatures and their timestamps into the buffers."""
+        k = len(temps)
+        if k == 0:
+            return
+        end = self._n + k
+        if end > self._cap:
+            self._grow(end)
+        self._temps[self._n:end] = temps
+        self._timestamps[self._n:end] = timestamps
+        self._times[self._n:end] = _parse_timestamps(timestamps)
+        self._index_block(temps, self._n)
+        self._n = end
+        self._dirty = True
+
+    def _index_block(self, temps: np.ndarray, offset: int) -> None:
+        """Append cold/hot positions for `temps`, stored starting at `offset`."""
+        cold = temps <= self._safe_min
+        hot = (temps >= self._safe_max) & ~cold  # same precedence as add_reading
+        self._cold_idx.frombytes((np.flatnonzero(cold) + offset).astype(np.int64).tobytes())
+        self._hot_idx.frombytes((np.flatnonzero(hot) + offset).astype(np.int64).tobytes())
+
+    def _reindex(self) -> None:
+        """Rebuild the cold/hot positions after a threshold change."""
+        self._cold_idx = array.array("q")
+        self._hot_idx = array.array("q")
+        self._index_block(self.temperatures, 0)
 
     def add_reading(self, r: TemperatureReading) -> None:
         """Add a single reading."""
-        self.readings.append(r)
-
-    def add_readings(self, readings: List[TemperatureReading]) -> None:
+        if self._n == self._cap:
+            self._grow(self._n + 1)
+        self._temps[self._n] = r.temperature
+        self._timestamps[self._n] = r.timestamp
+        self._times[self._n] = _parse_one(_to_iso(r.timestamp)) - SERVER_UTC_OFFSET
+        if r.temperature <= self._safe_min:
+            self._cold_idx.append(self._n)
+        elif r.temperature >= self._safe_max:
+            self._hot_idx.append(self._n)
+        self._n += 1
+        self._dirty = True
+
+    def add_readings(self, readings: Sequence[TemperatureReading]) -> None:
         """Add multiple readings."""
-        self.readings.extend(readings)
+        k = len(readings)
+        temps = np.fromiter((r.temperature for r in readings), dtype=np.float64, count=k)
+        self._append_block(temps, [r.timestamp for r in readings])
 
-    def _temps_array(self) -> np.ndarray:
-        """Return temperatures as a numpy array."""
-        if not self.readings:
-            return np.array([], dtype=float)
-        return np.array([r.temperature for r in self.readings], dtype=float)
+    def _scan(self) -> Tuple[int, float, float, float, np.ndarray]:
+        """Return count, min, max, mean and the out-of-range indices in one place.
+
+        Cached until readings or thresholds change. Callers must ensure at least
+        one reading is stored.
+        """
+        if self._dirty or self._scan_cache is None:
+            arr = self.temperatures
+            idx = np.flatnonzero((arr < self._safe_min) | (arr > self._safe_max))
+            self._scan_cache = (arr.size, float(arr.min()), float(arr.max()), float(arr.mean()), idx)
+            self._dirty = False
+        return self._scan_cache
 
     def compute_stats(self) -> dict:
-        """Compute count, min, max and mean using numpy."""
-        arr = self._temps_array()
-        if arr.size == 0:
+        """Compute count, min, max and mean (cached between new readings)."""
+        if self._n == 0:
             return {"count": 0, "min": None, "max": None, "mean": None}
-        return {
-            "count": int(arr.size),
-            "min": float(np.min(arr)),
-            "max": float(np.max(arr)),
-            "mean": float(np.mean(arr)),
-        }
+        n, mn, mx, mean, _ = self._scan()
+        return {"count": int(n), "min": mn, "max": mx, "mean": mean}
 
     def check_safety(self) -> List[TemperatureReading]:
         """Return readings outside the safe interval."""
-        return [r for r in self.readings if (r.temperature < self.safe_min or r.temperature > self.safe_max)]
+        arr = self.temperatures
+        # vectorized compare; only the violations are turned into Python objects
+        idx = np.flatnonzero((arr < self.safe_min) | (arr > self.safe_max))
+        return self._readings_at(idx)
+
+    def _readings_at(self, idx: np.ndarray) -> List[TemperatureReading]:
+        """Build readings only for the positions selected by `idx`."""
+        return [
+            TemperatureReading(float(t), ts)
+            for t, ts in zip(self.temperatures[idx], self.timestamps[idx])
+        ]
 
     def report(self) -> None:
         """Print a clear formatted report with alerts."""
-        stats = self.compute_stats()
         print("=== Temperature Monitor Report ===")
-        print(f"Count: {stats['count']}")
-        if stats["count"] > 0:
-            print(f"Min: {stats['min']:.2f} °C")
-            print(f"Max: {stats['max']:.2f} °C")
-            print(f"Mean: {stats['mean']:.2f} °C")
-        outliers = self.check_safety()
+        print(f"Count: {self._n}")
+        outliers: List[TemperatureReading] = []
+        if self._n > 0:
+            # one cached pass gives both the stats and the alerts
+            _, mn, mx, mean, idx = self._scan()
+            print(f"Min: {mn:.2f} °C")
+            print(f"Max: {mx:.2f} °C")
+            print(f"Mean: {mean:.2f} °C")
+            outliers = self._readings_at(idx)
         if not outliers:
             print("✅ All readings within safe range "
                   f"({self.safe_min:.1f}°C — {self.safe_max:.1f}°C).")
@@ -78,127 +293,187 @@ class TemperatureMonitor:
 
 
 class ApiClient:
-    """Simple client to consume /history and /stream from the Express app."""
+    """Simple async client to consume /history and /stream from the Express app."""
 
     def __init__(self, base_url: str = "https://sensor.juliomacedo.dev/"):
         self.base_url = base_url.rstrip("/")
+        # one pooled client so /history calls and /stream reconnects reuse sockets
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(10.0),
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
 
-    def fetch_history(self) -> List[TemperatureReading]:
+    async def fetch_history(self) -> List[TemperatureReading]:
         """Fetch /history and return list of TemperatureReading."""
         url = f"{self.base_url}/history"
-        resp = requests.get(url, timeout=10)
+        resp = await self._client.get(url)
         resp.raise_for_status()
-        items = resp.json()
-        return [TemperatureReading(float(it["temperature"]), it["timestamp"]) for it in items]
+        return _HISTORY_DECODER.decode(resp.content)
 
-    def stream(self, on_event: Callable[[TemperatureReading], None], stop_after: Optional[int] = None, timeout: Optional[float] = None) -> None:
+    async def fetch_history_iter(self) -> AsyncIterator[TemperatureReading]:
+        """Stream /history, yielding readings while the JSON array is still arriving.
+
+        For memory-bound callers only: the body is never held whole, but parsing is
+        much slower than fetch_history's one-shot decode.
+        """
+        url = f"{self.base_url}/history"
+        async with self._client.stream("GET", url) as resp:
+            resp.raise_for_status()
+            items = ijson.sendable_list()
+            parser = ijson.items_coro(items, "item", use_float=True)
+            async for chunk in resp.aiter_bytes():
+                parser.send(chunk)
+                for it in items:
+                    yield TemperatureReading(float(it["temperature"]), it["timestamp"])
+                del items[:]
+            parser.close()
+            for it in items:
+                yield TemperatureReading(float(it["temperature"]), it["timestamp"])
+
+    async def fetch_history_array(self) -> np.ndarray:
+        """Fetch /history temperatures as a float64 numpy array."""
+        url = f"{self.base_url}/history"
+        resp = await self._client.get(url)
+        resp.raise_for_status()
+        items = _HISTORY_TEMPS_DECODER.decode(resp.content)
+        return np.fromiter((it.temperature for it in items), dtype=np.float64, count=len(items))
+
+    async def stream(self, on_event: Callable[[TemperatureReading], None], stop_after: Optional[int] = None, timeout: Optional[float] = None) -> None:
         """Connect to SSE /stream and call on_event for each reading.
 
         stop_after: stop after N events
         timeout: stop after seconds
         """
         url = f"{self.base_url}/stream"
-        with requests.get(url, stream=True, timeout=(3.05, None)) as resp:
+        async with self._client.stream("GET", url, timeout=httpx.Timeout(None, connect=3.05)) as resp:
             resp.raise_for_status()
             event_count = 0
             start = time.time()
-            buffer = ""
-            for chunk in resp.iter_content(chunk_size=1):
-                if not chunk:
-                    continue
-                try:
-                    ch = chunk.decode("utf-8")
-                except Exception:
-                    continue
-                buffer += ch
-                if buffer.endswith("\n\n"):
-                    # SSE event ended
-                    lines = [ln for ln in buffer.splitlines() if ln.strip() != ""]
-                    for ln in lines:
-                        if ln.startswith("data:"):
-                            payload = ln[len("data:"):].strip()
-                            try:
-                                obj = json.loads(payload)
-                                r = TemperatureReading(float(obj["temperature"]), obj["timestamp"])
-                                on_event(r)
-                                event_count += 1
-                            except Exception:
-                                pass
-                    buffer = ""
-                if stop_after and event_count >= stop_after:
-                    break
+            async for payloads in _aiter_sse_batches(resp.aiter_bytes()):
+                for payload in payloads:
+                    try:
+                        on_event(_DECODER.decode(payload))
+                        event_count += 1
+                    except Exception:
+                        pass
+                    if stop_after and event_count >= stop_after:
+                        return
                 if timeout and (time.time() - start) >= timeout:
                     break
 
-    def stream_forever(self, on_event: Callable[[TemperatureReading], None], stop_event: threading.Event) -> None:
+    async def stream_forever(self, on_batch: Callable[[List[TemperatureReading]], None], stop_event: asyncio.Event) -> None:
         """Continuously consume /stream until stop_event is set. Reconnects on transient errors.
 
-        This method is suitable to run in a background thread. It will try to reconnect
-        if the connection drops, and will exit promptly when stop_event is set.
+        on_batch gets the readings from each network read. Run it as a task; cancel
+        the task to stop immediately.
         """
         url = f"{self.base_url}/stream"
         while not stop_event.is_set():
             try:
-                with requests.get(url, stream=True, timeout=(3.05, 10)) as resp:
+                async with self._client.stream("GET", url, timeout=httpx.Timeout(10.0, connect=3.05)) as resp:
                     resp.raise_for_status()
-                    buffer = ""
-                    for chunk in resp.iter_content(chunk_size=1):
+                    async for payloads in _aiter_sse_batches(resp.aiter_bytes()):
                         if stop_event.is_set():
                             break
-                        if not chunk:
-                            continue
-                        try:
-                            ch = chunk.decode("utf-8")
-                        except Exception:
-                            continue
-                        buffer += ch
-                        if buffer.endswith("\n\n"):
-                            lines = [ln for ln in buffer.splitlines() if ln.strip() != ""]
-                            for ln in lines:
-                                if ln.startswith("data:"):
-                                    payload = ln[len("data:"):].strip()
-                                    try:
-                                        obj = json.loads(payload)
-                                        r = TemperatureReading(float(obj["temperature"]), obj["timestamp"])
-                                        on_event(r)
-                                    except Exception:
-                                        pass
-                            buffer = ""
-            except requests.exceptions.RequestException:
+                        batch: List[TemperatureReading] = []
+                        for payload in payloads:
+                            try:
+                                batch.append(_DECODER.decode(payload))
+                            except Exception:
+                                pass
+                        if batch:
+                            on_batch(batch)
+            except httpx.HTTPError:
                 if stop_event.is_set():
                     break
                 # transient error, wait a bit then retry
-                time.sleep(1)
+                await asyncio.sleep(1)
                 continue
 
 
-# Demo usage
-if __name__ == "__main__":
+_stdin_lines: Optional[asyncio.Queue] = None
+
+
+async def _ainput(prompt: str = "") -> str:
+    """input() for the event loop; one daemon thread reads stdin into a queue."""
+    global _stdin_lines
+    if _stdin_lines is None:
+        loop = asyncio.get_running_loop()
+        lines: asyncio.Queue = asyncio.Queue()
+
+        def read() -> None:
+            while True:
+                line = sys.stdin.readline()
+                try:
+                    loop.call_soon_threadsafe(lines.put_nowait, line)
+                except RuntimeError:
+                    return  # loop already closed
+                if not line:
+                    return  # EOF
+
+        _stdin_lines = lines
+        threading.Thread(target=read, daemon=True).start()
+    print(prompt, end="", flush=True)
+    # a cancelled wait consumes nothing, so no line is lost to an abandoned read
+    line = await _stdin_lines.get()
+    if not line:
+        _stdin_lines.put_nowait(line)  # keep reporting EOF to later calls
+        raise EOFError
+    return line.rstrip("\r\n")
+
+
+async def main() -> None:
     client = ApiClient("https://sensor.juliomacedo.dev/")
     monitor = TemperatureMonitor(safe_min=20.0, safe_max=80.0)
 
-    def handle_event(reading: TemperatureReading):
+    def alert_states(lo: float, hi: float):
+        # (emoji, alert) per reading state, formatted once per bounds instead of per event:
+        # 0 in range, 1 below, 2 above, 3 at safe_min, 4 at safe_max
+        return (
+            ("✅", ""),
+            ("❄️", f" ⛔ BELOW safe_min ({lo}°C)"),
+            ("🔥", f" ⛔ ABOVE safe_max ({hi}°C)"),
+            ("⚠️", f" ⚠️ REACHED boundary ({lo}°C)"),
+            ("⚠️", f" ⚠️ REACHED boundary ({hi}°C)"),
+        )
+
+    lo, hi = monitor.safe_min, monitor.safe_max
+    states = alert_states(lo, hi)
+
+    # wall-clock label cache: strftime runs at most once per second
+    last_sec = 0
+    last_str = ""
+
+    def handle_event_batch(batch: List[TemperatureReading]):
         # improved real-time logging with timestamp and emojis for alerts
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        t = reading.temperature
-        ts = reading.timestamp
-        emoji = "✅"
-        alert = ""
-        if t < monitor.safe_min:
-            emoji = "❄️"
-            alert = f" ⛔ BELOW safe_min ({monitor.safe_min}°C)"
-        elif t > monitor.safe_max:
-            emoji = "🔥"
-            alert = f" ⛔ ABOVE safe_max ({monitor.safe_max}°C)"
-        elif t == monitor.safe_min or t == monitor.safe_max:
-            emoji = "⚠️"
-            alert = f" ⚠️ REACHED boundary ({monitor.safe_min if t==monitor.safe_min else monitor.safe_max}°C)"
-        print(f"[{now}] {emoji} {t:.2f} °C at {ts}{alert}")
-        monitor.add_reading(reading)
-
-    def fetch_and_show_history() -> List[TemperatureReading]:
+        nonlocal last_sec, last_str, lo, hi, states
+        if lo != monitor.safe_min or hi != monitor.safe_max:
+            # bounds changed since the table was built: rebuild it
+            lo, hi = monitor.safe_min, monitor.safe_max
+            states = alert_states(lo, hi)
+        sec = int(time.time())
+        if sec != last_sec:
+            last_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+            last_sec = sec
+        now = last_str
+        out: List[str] = []
+        for reading in batch:
+            t = reading.temperature
+            emoji, alert = states[1 if t < lo else 2 if t > hi else 3 if t == lo else 4 if t == hi else 0]
+            out.append(f"[{now}] {emoji} {t:.2f} °C at {reading.timestamp}{alert}\n")
+        # one write per batch instead of one print per reading
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+        # one block copy into the monitor buffers per batch
+        monitor.add_readings(batch)
+
+    async def fetch_and_show_history() -> List[TemperatureReading]:
         try:
-            history = client.fetch_history()
+            history = await client.fetch_history()
             print(f"Loaded {len(history)} readings from /history (showing up to 20)")
             for i, r in enumerate(history[:20], 1):
                 print(f"{i:3d}. {r.temperature:.2f} °C at {r.timestamp}")
@@ -209,81 +484,111 @@ if __name__ == "__main__":
             print(f"Could not fetch history: {e}")
             return []
 
-    def analyze_history_only() -> None:
+    async def analyze_history_only() -> None:
         # fetch history but print ONLY min, max and mean (three lines)
         try:
-            history = client.fetch_history()
-            temps = np.array([float(it.temperature) for it in history], dtype=float) if history else np.array([], dtype=float)
+            temps = await client.fetch_history_array()
             if temps.size == 0:
                 print("Min: -")
                 print("Max: -")
                 print("Mean: -")
                 return
-            print(f"Min: {np.min(temps):.2f}")
-            print(f"Max: {np.max(temps):.2f}")
-            print(f"Mean: {np.mean(temps):.2f}")
+            print(f"Min: {temps.min():.2f}")
+            print(f"Max: {temps.max():.2f}")
+            print(f"Mean: {temps.mean():.2f}")
         except Exception:
             # per requirement, do not print extra messages; show placeholders
             print("Min: -")
             print("Max: -")
             print("Mean: -")
 
-    def show_cold_violations() -> None:
-        low = [r for r in monitor.readings if r.temperature <= monitor.safe_min]
-        print(f"\n--- Cold readings <= {monitor.safe_min}°C ({len(low)}) ---")
-        if low:
-            for i, r in enumerate(low, 1):
-                print(f"❄️ {i:3d}. {r.temperature:.2f} °C at {r.timestamp}")
+    def show_cold_violations(window: Optional[float] = None) -> None:
+        temps = monitor.temperatures
+        low = monitor.cold_indices
+        if window is not None:
+            low = low[monitor.recent_mask(window, low)]
+        since = f" in the last {window:.0f}s" if window is not None else ""
+        print(f"\n--- Cold readings <= {monitor.safe_min}°C{since} ({len(low)}) ---")
+        if low.size:
+            timestamps = monitor.timestamps
+            for i, j in enumerate(low, 1):
+                print(f"❄️ {i:3d}. {temps[j]:.2f} °C at {timestamps[j]}")
         else:
             print("None ✅")
 
-    def show_hot_violations() -> None:
-        high = [r for r in monitor.readings if r.temperature >= monitor.safe_max]
-        print(f"\n--- Hot readings >= {monitor.safe_max}°C ({len(high)}) ---")
-        if high:
-            for i, r in enumerate(high, 1):
-                print(f"🔥 {i:3d}. {r.temperature:.2f} °C at {r.timestamp}")
+    def show_hot_violations(window: Optional[float] = None) -> None:
+        temps = monitor.temperatures
+        high = monitor.hot_indices
+        if window is not None:
+            high = high[monitor.recent_mask(window, high)]
+        since = f" in the last {window:.0f}s" if window is not None else ""
+        print(f"\n--- Hot readings >= {monitor.safe_max}°C{since} ({len(high)}) ---")
+        if high.size:
+            timestamps = monitor.timestamps
+            for i, j in enumerate(high, 1):
+                print(f"🔥 {i:3d}. {temps[j]:.2f} °C at {timestamps[j]}")
         else:
             print("None ✅")
 
-    while True:
-        print("\n=== Temperature Monitor Menu ===")
-        print("1) View history (sample)")
-        print("2) Stream live readings (infinite, press ENTER to stop)")
-        print("3) Analyze history (mean/min/max)")
-        print("4) Show cold violations (<= safe_min)")
-        print("5) Show hot violations (>= safe_max)")
-        print("0) Exit")
-        choice = input("Select option: ").strip()
-
-        if choice == "1":
-            fetch_and_show_history()
-
-        elif choice == "2":
-            print("Starting infinite stream. Press ENTER to stop and return to menu.")
-            stop_event = threading.Event()
-            t = threading.Thread(target=client.stream_forever, args=(handle_event, stop_event), daemon=True)
-            t.start()
-            try:
-                input()  # wait for user to press ENTER
-            except KeyboardInterrupt:
-                pass
-            stop_event.set()
-            t.join(timeout=5)
-            print(f"Streaming stopped. Accumulated readings: {len(monitor.readings)}")
+    try:
+        while True:
+            print("\n=== Temperature Monitor Menu ===")
+            print("1) View history (sample)")
+            print("2) Stream live readings (infinite, press ENTER to stop)")
+            print("3) Analyze history (mean/min/max)")
+            print("4) Show cold violations (<= safe_min)")
+            print("5) Show hot violations (>= safe_max)")
+            print("6) Show violations from the last minute")
+            print("0) Exit")
+            choice = (await _ainput("Select option: ")).strip()
+
+            if choice == "1":
+                await fetch_and_show_history()
+
+            elif choice == "2":
+                print("Starting infinite stream. Press ENTER to stop and return to menu.")
+                stop_event = asyncio.Event()
+                task = asyncio.create_task(client.stream_forever(handle_event_batch, stop_event))
+                # Ctrl+C stops the stream and returns to the menu instead of exiting
+                loop = asyncio.get_running_loop()
+                prev_sigint = signal.signal(signal.SIGINT, lambda *_: loop.call_soon_threadsafe(stop_event.set))
+                enter = asyncio.create_task(_ainput())  # wait for user to press ENTER
+                interrupted = asyncio.create_task(stop_event.wait())
+                try:
+                    await asyncio.wait({enter, interrupted}, return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    signal.signal(signal.SIGINT, prev_sigint)
+                    stop_event.set()
+                    for t in (task, enter, interrupted):
+                        t.cancel()
+                    for t in (task, enter, interrupted):
+                        with contextlib.suppress(asyncio.CancelledError, EOFError):
+                            await t
+                print(f"Streaming stopped. Accumulated readings: {len(monitor)}")
 
-        elif choice == "3":
-            analyze_history_only()
+            elif choice == "3":
+                await analyze_history_only()
 
-        elif choice == "4":
-            show_cold_violations()
+            elif choice == "4":
+                show_cold_violations()
 
-        elif choice == "5":
-            show_hot_violations()
+            elif choice == "5":
+                show_hot_violations()
 
-        elif choice == "0":
-            print("Exiting.")
-            break
+            elif choice == "6":
+                show_cold_violations(window=60)
+                show_hot_violations(window=60)
 
-        else:
-            print("Invalid option. Please choose a valid number.")
+            elif choice == "0":
+                print("Exiting.")
+                break
+
+            else:
+                print("Invalid option. Please choose a valid number.")
+    finally:
+        await client.aclose()
+
+
+# Demo usage
+if __name__ == "__main__":
+    asyncio.run(main())